@@ -7,7 +7,7 @@ gradient fills. It supports two rendering modes:
 
 1. PIXEL MODE (default): Converts ASCII art characters to SVG path rectangles.
    Best for fonts that use simple characters like '#' (e.g., banner3, big).
-   Each non-space character becomes a filled rectangle in the SVG.
+   Each run of non-space characters becomes a filled rectangle in the SVG.
 
 2. TEXT MODE (--text-mode): Uses toilet's native SVG export and transforms it.
    Best for fonts that use Unicode box-drawing characters (e.g., future, mono9).
@@ -34,15 +34,27 @@ from __future__ import annotations
 # =============================================================================
 
 # Standard library imports for core functionality
-import argparse  # CLI argument parsing
+import functools  # Memoization of repeated renders and font name checks
 import logging  # Structured logging to stderr
+import os  # Environment lookup for the cache directory
 import re  # Regular expressions for SVG transformation
-import subprocess  # External process execution (toilet/figlet)
 import sys  # System exit codes
 from dataclasses import dataclass  # Immutable data structures
 from enum import Enum  # Gradient preset enumeration
 from pathlib import Path  # Cross-platform path handling
-from typing import Final, TypeAlias  # Type hints for better code clarity
+from types import SimpleNamespace  # Arguments parsed without argparse
+from typing import TYPE_CHECKING, Final, TypeAlias  # Type hints for better code clarity
+
+# Deferred imports: these are only needed on some code paths, so they are
+# imported inside the functions that use them to keep CLI startup short
+# - argparse:   --help and usage errors (_build_parser)
+# - subprocess: running toilet/figlet
+# - shutil:     locating toilet/figlet on PATH
+# - hashlib, json: the on-disk caches (--cache, --list-fonts)
+if TYPE_CHECKING:
+    import argparse
+    from collections.abc import Callable
+    import subprocess
 
 # =============================================================================
 # PUBLIC API EXPORTS
@@ -82,7 +94,9 @@ logger = logging.getLogger(__name__)
 
 # Type aliases improve code readability by giving semantic meaning to string types
 Color: TypeAlias = str  # Hex color string in format "#RRGGBB"
-PathData: TypeAlias = str  # SVG path "d" attribute string (e.g., "M0,0h10v10h-10Z")
+# SVG path "d" attribute as ASCII bytes (e.g., b"M0,0h10v10h-10Z")
+# Path data is pure ASCII, so it stays bytes from grid_to_paths to the output file
+PathData: TypeAlias = bytes
 
 # =============================================================================
 # CONSTANTS
@@ -97,13 +111,73 @@ DEFAULT_SCALE: Final[int] = 10
 # Default font: banner3 is widely available and produces clean block-style output
 DEFAULT_FONT: Final[str] = "banner3"
 
+# Default gradient preset (lowercase GradientPreset member name)
+DEFAULT_GRADIENT: Final[str] = "sweet_dracula"
+
 # Security: Font name validation pattern to prevent path traversal attacks
 # Only allows alphanumeric characters, hyphens, and underscores
 # Prevents inputs like "../../../etc/passwd" or "font;rm -rf /"
 FONT_NAME_PATTERN: Final[re.Pattern[str]] = re.compile(r"^[a-zA-Z0-9_-]+$")
 
-# Validation pattern for hex color codes (exactly 6 hex digits after #)
-HEX_COLOR_PATTERN: Final[re.Pattern[str]] = re.compile(r"^#[0-9a-fA-F]{6}$")
+# Valid hex color digits ("#" followed by exactly 6 of these)
+# Checked with a plain set lookup rather than a regex: every preset stop is
+# validated at import time, so this runs on every invocation
+HEX_DIGITS: Final[frozenset[str]] = frozenset("0123456789abcdefABCDEF")
+
+# Pixel mode SVG document template (ASCII bytes), split around its variable
+# parts; generate_svg joins these with the dimensions, gradient and path data
+# in a single pass instead of re-evaluating one large f-string template
+_SVG_HEAD: Final[bytes] = (
+    b'<?xml version="1.0" encoding="UTF-8"?>\n'
+    b'<svg xmlns="http://www.w3.org/2000/svg"\n'
+    b'     viewBox="0 0 '
+)
+_SVG_WIDTH: Final[bytes] = b'"\n     width="'
+_SVG_HEIGHT: Final[bytes] = b'px"\n     height="'
+_SVG_GRADIENT_OPEN: Final[bytes] = b'px">\n  <defs>\n    <linearGradient id="'
+_SVG_GRADIENT_STOPS: Final[bytes] = b'" x1="0%" y1="0%" x2="100%" y2="0%">\n'
+_SVG_PATH_OPEN: Final[bytes] = b'\n    </linearGradient>\n  </defs>\n  <path d="'
+_SVG_PATH_FILL: Final[bytes] = b'" fill="url(#'
+_SVG_TAIL: Final[bytes] = b')"/>\n</svg>'
+
+# Text mode gradient definition (bytes), filled in per call with
+# %-formatting: gradient id, SVG width, <stop> elements
+# gradientUnits="userSpaceOnUse" makes x1/x2 use SVG coordinate system
+# instead of relative to each element's bounding box
+_TEXT_GRADIENT_DEF_TEMPLATE: Final[bytes] = (
+    b"  <defs>\n"
+    b'    <linearGradient id="%s" x1="0" y1="0" x2="%d" y2="0"'
+    b' gradientUnits="userSpaceOnUse">\n'
+    b"%s\n"
+    b"    </linearGradient>\n"
+    b"  </defs>"
+)
+
+# Text mode SVG transformation patterns, compiled once at import
+# render_text_svg applies these to toilet's native SVG export, which is kept
+# as raw bytes (toilet emits UTF-8; every pattern here is ASCII)
+# toilet SVG header looks like: <svg width="96" height="30" ...>
+# Only searched within that opening tag, never the whole document
+_WIDTH_RE: Final[re.Pattern[bytes]] = re.compile(rb'width="(\d+)"')
+# Rects to drop: the black background rect toilet adds behind every character
+# cell, and the backdrop rect some toilet versions add. One alternation so
+# both are removed in the same scan
+# Each match also takes the rest of its line and any blank lines after it,
+# so removals never leave runs of empty lines behind to clean up afterwards
+_SVG_RECT_RE: Final[re.Pattern[bytes]] = re.compile(
+    rb'(?:<rect[^>]*style="fill:#000"[^>]*/>|<rect[^>]*class="backdrop"[^>]*/>)'
+    rb"(?:[ \t]*\n)*"
+)
+# Text fill colors (3 or 6 hex digits), replaced by the gradient reference
+_FILL_HEX_RE: Final[re.Pattern[bytes]] = re.compile(rb'style="fill:#[0-9a-fA-F]{3,6}"')
+
+# Pixel mode scanners: filled cells are any character except space
+# Compiled once so grid_to_paths classifies characters in the regex engine's
+# C loop rather than comparing one character at a time in Python
+# Each newline is matched on its own so the scan can track the current row
+# in the joined grid lines, whose rows have different lengths
+_NONSPACE_CELL: Final[re.Pattern[str]] = re.compile(r"\n|[^ \n]")
+_NONSPACE_RUN: Final[re.Pattern[str]] = re.compile(r"\n|[^ \n]+")
 
 
 # =============================================================================
@@ -179,7 +253,9 @@ class GradientStop:
         Raises:
             ValidationError: If color format is invalid or offset out of range
         """
-        if not HEX_COLOR_PATTERN.match(self.color):
+        color = self.color
+        # Length and "#" checks first, then all 6 digits in one C-level pass
+        if len(color) != 7 or color[0] != "#" or not HEX_DIGITS.issuperset(color[1:]):
             msg = f"Invalid hex color format: {self.color!r}. Expected #RRGGBB"
             raise ValidationError(msg)
         if not 0 <= self.offset_percent <= 100:
@@ -209,49 +285,98 @@ class GradientPreset(Enum):
 
     # Full rainbow gradient - the default and most colorful option
     SWEET_DRACULA = (
-        GradientStop("#ff5555", 0),  # Red - Dracula red
-        GradientStop("#ffb86c", 16),  # Orange - Dracula orange
-        GradientStop("#f1fa8c", 33),  # Yellow - Dracula yellow
-        GradientStop("#50fa7b", 50),  # Green - Dracula green
-        GradientStop("#8be9fd", 66),  # Cyan - Dracula cyan
-        GradientStop("#bd93f9", 83),  # Purple - Dracula purple
-        GradientStop("#ff79c6", 100),  # Pink - Dracula pink
+        ("#ff5555", 0),  # Red - Dracula red
+        ("#ffb86c", 16),  # Orange - Dracula orange
+        ("#f1fa8c", 33),  # Yellow - Dracula yellow
+        ("#50fa7b", 50),  # Green - Dracula green
+        ("#8be9fd", 66),  # Cyan - Dracula cyan
+        ("#bd93f9", 83),  # Purple - Dracula purple
+        ("#ff79c6", 100),  # Pink - Dracula pink
     )
 
     # Purple to pink - elegant two-tone gradient
     DRACULA_PURPLE = (
-        GradientStop("#bd93f9", 0),  # Purple - Dracula purple
-        GradientStop("#ff79c6", 100),  # Pink - Dracula pink
+        ("#bd93f9", 0),  # Purple - Dracula purple
+        ("#ff79c6", 100),  # Pink - Dracula pink
     )
 
     # Cyan to green - cool tech/cyber aesthetic
     CYBER_CYAN = (
-        GradientStop("#8be9fd", 0),  # Cyan - Dracula cyan
-        GradientStop("#50fa7b", 100),  # Green - Dracula green
+        ("#8be9fd", 0),  # Cyan - Dracula cyan
+        ("#50fa7b", 100),  # Green - Dracula green
     )
 
     # Red to yellow - warm sunset colors
     SUNSET = (
-        GradientStop("#ff5555", 0),  # Red - Dracula red
-        GradientStop("#ffb86c", 50),  # Orange - Dracula orange
-        GradientStop("#f1fa8c", 100),  # Yellow - Dracula yellow
+        ("#ff5555", 0),  # Red - Dracula red
+        ("#ffb86c", 50),  # Orange - Dracula orange
+        ("#f1fa8c", 100),  # Yellow - Dracula yellow
     )
 
     # Solid white - for when you want no gradient effect
     MONO_WHITE = (
-        GradientStop("#f8f8f2", 0),  # Foreground - Dracula foreground
-        GradientStop("#f8f8f2", 100),  # Same color = no gradient
+        ("#f8f8f2", 0),  # Foreground - Dracula foreground
+        ("#f8f8f2", 100),  # Same color = no gradient
     )
 
-    @property
+    @functools.cached_property
     def stops(self) -> tuple[GradientStop, ...]:
         """
         Return the gradient stops for this preset.
 
+        Member values are raw (color, offset) pairs; the validated
+        GradientStop objects are built on first access and cached on the
+        member, so importing the module constructs none of them.
+
         Returns:
             Tuple of GradientStop objects defining this gradient
         """
-        return self.value
+        return tuple(GradientStop(color, offset) for color, offset in self.value)
+
+    @functools.cached_property
+    def stops_xml(self) -> str:
+        """
+        Return this preset's <stop> elements as indented SVG XML.
+
+        Presets never change, so the fragment is formatted on first access
+        and cached on the member; only the preset actually used is built.
+
+        Returns:
+            One <stop .../> element per line, ready to embed in a gradient
+        """
+        return _format_stops_xml(self.stops)
+
+
+def _format_stops_xml(stops: tuple[GradientStop, ...]) -> str:
+    """
+    Format gradient stops as indented SVG <stop> elements, one per line.
+    """
+    # A list rather than a generator: str.join materializes its argument
+    # anyway, and a list lets it size the result in one pass
+    return "\n".join(
+        [
+            f'      <stop offset="{stop.offset_percent}%" stop-color="{stop.color}"/>'
+            for stop in stops
+        ]
+    )
+
+
+def _solid_color(gradient: GradientPreset | tuple[GradientStop, ...]) -> str | None:
+    """
+    Return the color shared by every stop of a gradient, or None if they differ.
+    """
+    stops = gradient.stops if isinstance(gradient, GradientPreset) else gradient
+    colors = {stop.color.lower() for stop in stops}
+    return colors.pop() if len(colors) == 1 else None
+
+
+def _gradient_stops_xml(gradient: GradientPreset | tuple[GradientStop, ...]) -> str:
+    """
+    Return the <stop> XML for a preset (cached) or custom stop tuple.
+    """
+    if isinstance(gradient, GradientPreset):
+        return gradient.stops_xml
+    return _format_stops_xml(gradient)
 
 
 @dataclass(frozen=True, slots=True)
@@ -260,12 +385,13 @@ class GridResult:
     Result from rendering text to an ASCII character grid.
 
     This is the intermediate representation used in pixel mode.
-    The grid contains the raw ASCII art output from toilet/figlet,
-    with all lines padded to the same width.
+    The grid contains the raw ASCII art output from toilet/figlet.
+    Lines are not padded: trailing blanks carry no pixels, so each line
+    keeps its own length and width records the longest one.
 
     Attributes:
         lines: Tuple of strings, each representing one row of the ASCII art
-        width: Maximum width in characters (all lines are padded to this)
+        width: Maximum width in characters (the length of the longest line)
         height: Number of lines in the grid
 
     Example:
@@ -287,8 +413,8 @@ class PathResult:
     construct the final SVG document.
 
     Attributes:
-        path_data: SVG path "d" attribute string containing all rectangles
-                   Format: "M0,0h10v10h-10Z M10,0h10v10h-10Z ..."
+        path_data: SVG path "d" attribute (ASCII bytes) containing all rectangles
+                   Format: b"M0,0h10v10h-10Z M10,0h10v10h-10Z ..."
                    Each "M...Z" segment is one filled rectangle
         width: Total SVG width in units (grid_width * scale)
         height: Total SVG height in units (grid_height * scale)
@@ -310,6 +436,7 @@ class PathResult:
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=64)
 def validate_font_name(font: str) -> None:
     """
     Validate font name to prevent command injection and path traversal attacks.
@@ -323,6 +450,10 @@ def validate_font_name(font: str) -> None:
     Only alphanumeric characters, hyphens, and underscores are allowed.
     This matches the naming convention used by toilet/figlet fonts.
 
+    Memoized: callers render many texts with a handful of fonts, so valid
+    names skip the regex match after the first call. Invalid names raise
+    every time (exceptions are never cached).
+
     Args:
         font: Font name to validate (e.g., "banner3", "future", "mono9")
 
@@ -378,9 +509,12 @@ def validate_text(text: str) -> None:
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=128)
 def render_text_grid(
     text: str,
     font: str = DEFAULT_FONT,
+    *,
+    disk_cache: bool = False,
 ) -> GridResult:
     """
     Render text to ASCII character grid using toilet or figlet.
@@ -393,22 +527,29 @@ def render_text_grid(
     If toilet is not installed, it falls back to figlet which is more
     commonly available on Unix systems.
 
+    Results are memoized in-process (GridResult is immutable, so cached
+    instances are safe to share); use render_text_grid.cache_clear() to
+    drop them. With disk_cache=True the ASCII art is also stored in the
+    user's cache directory (see _cache_dir) so repeated CLI invocations
+    skip the subprocess entirely.
+
     Process:
         1. Validate text and font name for security
-        2. Try toilet subprocess, fall back to figlet if not found
-        3. Capture stdout and split into lines
-        4. Pad all lines to equal width (required for grid processing)
-        5. Return structured GridResult
+        2. Return cached ASCII art if disk_cache is enabled and it exists
+        3. Otherwise try toilet subprocess, fall back to figlet if not found
+        4. Capture stdout and split into lines
+        5. Return structured GridResult (lines are left unpadded)
 
     Args:
         text: The text to convert to ASCII art (e.g., "Hello World")
         font: Font name for toilet/figlet (e.g., "banner3", "big", "slant")
               Must match FONT_NAME_PATTERN for security
+        disk_cache: Read and write the on-disk render cache (default: False)
 
     Returns:
         GridResult containing:
-        - lines: Tuple of equal-length strings (the ASCII art rows)
-        - width: Character width of each line
+        - lines: Tuple of strings (the ASCII art rows, unpadded)
+        - width: Character width of the longest line
         - height: Number of lines
 
     Raises:
@@ -425,84 +566,48 @@ def render_text_grid(
     validate_text(text)
     validate_font_name(font)
 
-    # Try toilet first (more features), then figlet (more common)
-    # The "--" separates options from text, preventing text starting with "-"
-    # from being interpreted as an option
-    commands = [
-        ["toilet", "-f", font, "--", text],
-        ["figlet", "-f", font, "--", text],
-    ]
-
-    last_error: Exception | None = None
-    for cmd in commands:
-        try:
-            # Security: shell=False (default) prevents shell injection
-            # capture_output=True captures both stdout and stderr
-            # text=True returns strings instead of bytes
-            # check=True raises CalledProcessError on non-zero exit
-            # timeout=30 prevents hanging on pathological inputs
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=30,
-            )
-            break  # Success - exit the loop
-        except FileNotFoundError:
-            # This tool not installed, try next one
-            last_error = FileNotFoundError(f"{cmd[0]} not found")
-            continue
-        except subprocess.CalledProcessError as e:
-            # Tool returned error (e.g., font not found)
-            last_error = e
-            continue
-        except subprocess.TimeoutExpired as e:
-            # Tool took too long - fail immediately, don't try fallback
-            msg = f"Command timed out: {' '.join(cmd)}"
-            raise RenderError(msg) from e
-    else:
-        # Loop completed without break = all commands failed
-        msg = "Neither toilet nor figlet available or both failed"
-        raise RenderError(msg) from last_error
-
-    # Process the ASCII art output
-    # Remove trailing newline and split into individual lines
-    raw_lines = result.stdout.rstrip("\n").split("\n")
+    # Only touch the filesystem when the caller opted in
+    cache_file = _grid_cache_file(text, font) if disk_cache else None
+    raw_lines = _read_grid_cache(cache_file) if cache_file else None
 
-    # Sanity check: ensure we got actual output
-    if not raw_lines or all(not line for line in raw_lines):
-        msg = f"No output from {cmd[0]} for text: {text!r}"
-        raise RenderError(msg)
-
-    # Normalize line lengths by padding shorter lines with spaces
-    # This is required because grid_to_paths iterates by (x, y) position
-    max_width = max(len(line) for line in raw_lines)
-    padded_lines = tuple(line.ljust(max_width) for line in raw_lines)
+    if raw_lines is None:
+        raw_lines = _render_ascii_lines(text, font)
+        if cache_file:
+            _write_cache_json(cache_file, raw_lines)
 
+    # Lines are not padded to a common width: grid_to_paths only looks at
+    # non-space characters, so padding would be work it immediately skips
     return GridResult(
-        lines=padded_lines,
-        width=max_width,
-        height=len(padded_lines),
+        lines=tuple(raw_lines),
+        width=max(len(line) for line in raw_lines),
+        height=len(raw_lines),
     )
 
 
 def grid_to_paths(
     grid: GridResult,
     scale: int = DEFAULT_SCALE,
+    *,
+    merge_runs: bool = True,
 ) -> PathResult:
     """
     Convert ASCII character grid to SVG path data (pixel mode).
 
-    This is the second step in PIXEL MODE rendering. It converts each
-    non-space character in the ASCII art grid into a filled rectangle
+    This is the second step in PIXEL MODE rendering. It converts the
+    non-space characters in the ASCII art grid into filled rectangles
     in SVG path format.
 
     The approach is simple but effective:
     - Each character position becomes a potential pixel
     - Space characters are skipped (transparent)
     - All other characters become filled rectangles
-    - All rectangles are the same size (scale x scale)
+    - Horizontal runs of filled characters are merged into one rectangle
+      (one scale units tall, run_length * scale units wide)
+
+    Merging runs produces exactly the same filled area with far fewer path
+    segments - block fonts like banner3 typically shrink 5-20x. Pass
+    merge_runs=False to emit one (scale x scale) square per character if a
+    renderer rasterizes the merged rectangles differently.
 
     This works well for fonts that use simple fill characters like '#',
     but loses detail for fonts with varying characters (use text mode
@@ -522,45 +627,98 @@ def grid_to_paths(
         grid: GridResult from render_text_grid containing ASCII art lines
         scale: Size of each character cell in SVG units (default: 10)
                Larger scale = larger output SVG
+        merge_runs: Merge horizontal runs into single rectangles (default: True)
 
     Returns:
         PathResult containing:
-        - path_data: Space-separated SVG path commands for all rectangles
+        - path_data: Space-separated SVG path commands for all rectangles (bytes)
         - width: Total SVG width (grid.width * scale)
         - height: Total SVG height (grid.height * scale)
 
     Example:
-        >>> grid = GridResult(lines=("# #", " # "), width=3, height=2)
+        >>> grid = GridResult(lines=("## #", " ## "), width=4, height=2)
         >>> result = grid_to_paths(grid, scale=10)
-        >>> # Creates rectangles at (0,0), (20,0), and (10,10)
+        >>> # Creates rectangles (0,0) 20 wide, (30,0) 10 wide, (10,10) 20 wide
     """
     # Handle empty grid edge case
     if not grid.lines:
-        return PathResult(path_data="", width=0, height=0)
-
-    path_segments: list[str] = []
-
-    # Iterate through each character position in the grid
-    for y, line in enumerate(grid.lines):
-        for x, char in enumerate(line):
-            # Skip whitespace - these become transparent in the SVG
-            # Only space is skipped; other whitespace chars become pixels
-            if char == " ":
+        return PathResult(path_data=b"", width=0, height=0)
+
+    # All rectangles are written into one growing bytearray, each followed by
+    # the space separator, instead of collecting strings for a later join
+    out = bytearray()
+
+    # Scan the whole grid as one buffer (rows joined by "\n") so the regex
+    # engine makes a single pass instead of one call per row
+    # Rows keep their own lengths; newline matches advance the row counter
+    # and mark where the next row starts, so x = position - row_start
+    row_width = max(map(len, grid.lines))
+    buffer = "\n".join(grid.lines)
+    y = 0
+    row_start = 0
+
+    # Decimal strings for every multiple of scale the grid can produce
+    # (column x, row y and run widths are all < row_width + 1 or height), so
+    # the scan below never converts an integer to text - it only indexes
+    scaled = [b"%d" % (n * scale) for n in range(max(row_width, len(grid.lines)) + 1)]
+
+    # Precompute the "M{x}" move command for every column once
+    # Columns repeat on every row
+    column_moves = [b"M" + scaled[x] for x in range(row_width)]
+
+    if merge_runs:
+        # Y position is shared by every run in a row
+        row_coords = [b"," + scaled[y] + b"h" for y in range(len(grid.lines))]
+
+        # The closing edge draws left by the run width; its decimal strings
+        # are formatted from the negated value (not "-" + width) so a
+        # negative scale still yields valid path data
+        negated = [b"%d" % -(n * scale) for n in range(row_width + 1)]
+
+        # %-formatting with the constant "v{h}" edge baked into the template
+        # is cheaper than an f-string for this simple repeated substitution
+        run_template = b"%%s%%s%%sv%dh%%sZ " % scale
+
+        # Find maximal runs of non-space characters with the regex
+        # engine (a C-level scan) instead of visiting every character
+        for match in _NONSPACE_RUN.finditer(buffer):
+            start, end = match.span()
+            if buffer[start] == "\n":
+                y += 1
+                row_start = end
                 continue
+            x = start - row_start
+            out += run_template % (
+                column_moves[x],
+                row_coords[y],
+                scaled[end - start],
+                negated[end - start],
+            )
+    else:
+        # The "h{w}v{h}h{-w}Z" tail is identical for every square, so build
+        # it once instead of formatting three integers per cell
+        # Everything after the move target is shared by the whole row:
+        # Y position (row * scale), then draw right, down, left, close, separator
+        cell_suffix = b"h%dv%dh%dZ " % (scale, scale, -scale)
+        row_tails = [b"," + scaled[y] + cell_suffix for y in range(len(grid.lines))]
+
+        # Let the regex engine find filled cells (only space is skipped;
+        # other whitespace chars become pixels), so blank rows and gaps
+        # cost no Python-level iterations
+        # Each grid cell becomes a (scale x scale) rectangle
+        for match in _NONSPACE_CELL.finditer(buffer):
+            start = match.start()
+            if buffer[start] == "\n":
+                y += 1
+                row_start = start + 1
+                continue
+            out += column_moves[start - row_start]
+            out += row_tails[y]
 
-            # Calculate pixel position in SVG coordinates
-            # Each grid cell becomes a (scale x scale) rectangle
-            px = x * scale  # X position = column * scale
-            py = y * scale  # Y position = row * scale
-
-            # Generate SVG path for this rectangle
-            # Format: Move to corner, draw right, down, left, close
-            path_segments.append(f"M{px},{py}h{scale}v{scale}h{-scale}Z")
-
-    # Join all rectangle paths with spaces
+    # Drop the separator after the last rectangle
     # SVG path "d" attribute can contain multiple subpaths separated by spaces
     return PathResult(
-        path_data=" ".join(path_segments),
+        path_data=bytes(out.rstrip(b" ")),
         width=grid.width * scale,
         height=grid.height * scale,
     )
@@ -570,7 +728,7 @@ def generate_svg(
     path_result: PathResult,
     gradient: GradientPreset | tuple[GradientStop, ...],
     gradient_id: str = "headerGradient",
-) -> str:
+) -> bytes:
     """
     Generate complete SVG XML document with gradient fill (pixel mode).
 
@@ -604,42 +762,50 @@ def generate_svg(
                      Must be unique if embedding multiple SVGs in one document
 
     Returns:
-        Complete SVG XML string ready to write to file or output
+        Complete SVG XML document as UTF-8 bytes, ready to write to a file
+        opened in binary mode or to sys.stdout.buffer
 
     Example:
-        >>> path = PathResult(path_data="M0,0h10v10h-10Z", width=100, height=70)
+        >>> path = PathResult(path_data=b"M0,0h10v10h-10Z", width=100, height=70)
         >>> svg = generate_svg(path, GradientPreset.CYBER_CYAN)
-        >>> with open("header.svg", "w") as f:
+        >>> with open("header.svg", "wb") as f:
         ...     f.write(svg)
     """
-    # Extract gradient stops from preset enum or use custom tuple directly
-    stops = gradient.stops if isinstance(gradient, GradientPreset) else gradient
-
     # Build the <stop> elements for the gradient definition
     # Each stop specifies a color at a percentage position along the gradient
-    stops_xml = "\n".join(
-        f'      <stop offset="{stop.offset_percent}%" stop-color="{stop.color}"/>'
-        for stop in stops
-    )
+    # Presets reuse their cached fragment
+    stops_xml = _gradient_stops_xml(gradient)
 
-    # Generate complete SVG document
+    # Generate complete SVG document by joining the constant template
+    # pieces around the few variable parts (see _SVG_* constants)
     # - viewBox defines the coordinate system (0,0 to width,height)
     # - width/height set the default display size
     # - linearGradient with x1=0%, x2=100% creates left-to-right gradient
     # - path element contains all rectangles and references gradient by ID
-    svg = f"""\
-<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg"
-     viewBox="0 0 {path_result.width} {path_result.height}"
-     width="{path_result.width}px"
-     height="{path_result.height}px">
-  <defs>
-    <linearGradient id="{gradient_id}" x1="0%" y1="0%" x2="100%" y2="0%">
-{stops_xml}
-    </linearGradient>
-  </defs>
-  <path d="{path_result.path_data}" fill="url(#{gradient_id})"/>
-</svg>"""
+    width = b"%d" % path_result.width
+    height = b"%d" % path_result.height
+    gid = gradient_id.encode("utf-8")
+    svg = b"".join(
+        [
+            _SVG_HEAD,
+            width,
+            b" ",
+            height,
+            _SVG_WIDTH,
+            width,
+            _SVG_HEIGHT,
+            height,
+            _SVG_GRADIENT_OPEN,
+            gid,
+            _SVG_GRADIENT_STOPS,
+            stops_xml.encode("ascii"),
+            _SVG_PATH_OPEN,
+            path_result.path_data,
+            _SVG_PATH_FILL,
+            gid,
+            _SVG_TAIL,
+        ]
+    )
 
     return svg
 
@@ -719,7 +885,7 @@ def render_text_svg(
     font: str = DEFAULT_FONT,
     gradient: GradientPreset | tuple[GradientStop, ...] = GradientPreset.SWEET_DRACULA,
     gradient_id: str = "headerGradient",
-) -> str:
+) -> bytes:
     """
     Render text to SVG using toilet's native SVG export with gradient (text mode).
 
@@ -733,7 +899,9 @@ def render_text_svg(
         3. Remove black background rectangles (toilet adds these)
         4. Inject gradient definition into the SVG
         5. Replace text fill colors with gradient reference
-        6. Clean up the resulting SVG
+
+    Solid gradients (every stop the same color, like MONO_WHITE) skip steps
+    2 and 4: text fills are set to that color directly.
 
     Why gradientUnits="userSpaceOnUse"?
         By default, SVG gradients use "objectBoundingBox" which means the
@@ -752,7 +920,9 @@ def render_text_svg(
         gradient_id: XML ID for gradient definition (for embedding multiple SVGs)
 
     Returns:
-        Complete SVG XML string with gradient fill applied to text
+        Complete SVG XML document as UTF-8 bytes with gradient fill applied
+        to text. toilet's output is never decoded: every transformation
+        works on the raw bytes.
 
     Raises:
         ValidationError: If text or font validation fails
@@ -762,95 +932,80 @@ def render_text_svg(
         Unlike pixel mode, this requires toilet specifically - figlet does
         not support SVG export. If toilet is not available, use pixel mode.
 
+        toilet's raw SVG is memoized per (text, font), so re-rendering the
+        same text with a different gradient skips the subprocess. Call
+        _toilet_svg.cache_clear() to force a fresh toilet run.
+
     Example:
         >>> svg = render_text_svg("Hi", "future", GradientPreset.CYBER_CYAN)
-        >>> with open("header.svg", "w") as f:
+        >>> with open("header.svg", "wb") as f:
         ...     f.write(svg)
     """
     # Security: validate inputs before subprocess call
     validate_text(text)
     validate_font_name(font)
 
-    # Run toilet with SVG export mode
-    # -E svg: Export format SVG
-    # -f font: Use specified font
-    # --: End of options (text starting with - won't be misinterpreted)
-    try:
-        result = subprocess.run(
-            ["toilet", "-f", font, "-E", "svg", "--", text],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=30,
-        )
-    except FileNotFoundError:
-        # toilet not installed - this mode requires toilet specifically
-        msg = "toilet not found - required for text mode SVG export"
-        raise RenderError(msg) from None
-    except subprocess.CalledProcessError as e:
-        # toilet returned error (e.g., font not found)
-        msg = f"toilet failed: {e.stderr}"
-        raise RenderError(msg) from e
-    except subprocess.TimeoutExpired as e:
-        msg = "toilet command timed out"
-        raise RenderError(msg) from e
-
-    svg_content = result.stdout
-
-    # Extract SVG width from the output for gradient coordinate calculation
-    # toilet SVG looks like: <svg width="96" height="30" ...>
-    width_match = re.search(r'width="(\d+)"', svg_content)
-    svg_width = int(width_match.group(1)) if width_match else 100
-
-    # Extract gradient stops from preset or use custom tuple
-    stops = gradient.stops if isinstance(gradient, GradientPreset) else gradient
+    # toilet's raw SVG depends only on (text, font), so it is cached
+    # separately from the gradient transformation below
+    svg_content = _toilet_svg(text, font)
 
-    # Build gradient stop elements
-    stops_xml = "\n".join(
-        f'      <stop offset="{stop.offset_percent}%" stop-color="{stop.color}"/>'
-        for stop in stops
-    )
+    # A gradient whose stops all share one color needs no <defs> block
+    solid_color = _solid_color(gradient)
 
-    # Create gradient definition with absolute coordinates
-    # gradientUnits="userSpaceOnUse" makes x1/x2 use SVG coordinate system
-    # instead of relative to each element's bounding box
-    gradient_def = f"""  <defs>
-    <linearGradient id="{gradient_id}" x1="0" y1="0" x2="{svg_width}" y2="0" gradientUnits="userSpaceOnUse">
-{stops_xml}
-    </linearGradient>
-  </defs>"""
+    # Gradient stop elements (prebuilt for presets)
+    stops_xml = "" if solid_color is not None else _gradient_stops_xml(gradient)
 
     # ==========================================================================
     # SVG TRANSFORMATION
     # Transform toilet's SVG output to use our gradient instead of solid colors
     # ==========================================================================
 
-    # Step 1: Remove black background rectangles
-    # toilet adds <rect style="fill:#000" .../> for each character cell background
-    # We want transparent background, so remove these entirely
-    svg_content = re.sub(r'<rect[^>]*style="fill:#000"[^>]*/>\n?', "", svg_content)
-
-    # Step 2: Inject gradient definition after opening <svg> tag
-    # Uses regex backreference \1 to preserve the original <svg ...> tag
-    svg_content = re.sub(r"(<svg[^>]*>)", r"\1\n" + gradient_def, svg_content)
-
-    # Step 3: Replace text fill color with gradient reference
-    # toilet uses style="fill:#aaa" (gray) - we replace with gradient URL
-    # Matches 3 or 6 hex digit colors to handle both #rgb and #rrggbb
-    svg_content = re.sub(
-        r'style="fill:#[0-9a-fA-F]{3,6}"',
-        f'style="fill:url(#{gradient_id})"',
-        svg_content,
-    )
+    if solid_color is not None:
+        # Solid color: no gradient definition, fills use the color itself
+        fill = b'style="fill:' + solid_color.encode("ascii") + b'"'
+        header = b""
+        header_end = 0
+    else:
+        # Locate the opening <svg ...> tag once; the width is read from it
+        # and the gradient definition is spliced in right after it
+        # toilet SVG looks like: <svg width="96" height="30" ...>
+        svg_start = svg_content.find(b"<svg")
+        header_end = svg_content.find(b">", svg_start) + 1 if svg_start != -1 else 0
+
+        # Extract SVG width from the header for gradient coordinate calculation
+        width_match = _WIDTH_RE.search(svg_content, svg_start, header_end)
+        svg_width = int(width_match.group(1)) if width_match else 100
+
+        # Step 1: Keep the opening <svg> tag and inject the gradient definition
+        # with absolute coordinates right after it by slicing (see
+        # _TEXT_GRADIENT_DEF_TEMPLATE for why userSpaceOnUse); no <svg> tag
+        # found means nothing to inject into
+        header = b""
+        if header_end:
+            gradient_def = _TEXT_GRADIENT_DEF_TEMPLATE % (
+                gradient_id.encode("utf-8"),
+                svg_width,
+                stops_xml.encode("ascii"),
+            )
+            header = svg_content[:header_end] + b"\n" + gradient_def
+        fill = b'style="fill:url(#' + gradient_id.encode("utf-8") + b')"'
 
-    # Step 4: Remove backdrop rect if present (some toilet versions add this)
-    svg_content = re.sub(r'<rect[^>]*class="backdrop"[^>]*/>\n?', "", svg_content)
+    # Step 2: Remove black background and backdrop rectangles from the body
+    # (everything after <svg ...>, or the whole document for solid colors)
+    # toilet adds <rect style="fill:#000" .../> for each character cell background
+    # (some versions also add a backdrop rect). We want transparent background,
+    # so remove these entirely, both kinds in one pass
+    body = _SVG_RECT_RE.sub(b"", svg_content[header_end:])
 
-    # Step 5: Clean up multiple consecutive empty lines left by removals
-    # Replace 3+ newlines with just 2 for cleaner output
-    svg_content = re.sub(r"\n{3,}", "\n\n", svg_content)
+    # Step 3: Replace text fill colors with the gradient reference (or solid
+    # color); toilet uses style="fill:#aaa" (gray) - 3 to 6 hex digit colors
+    # match. Runs after step 2 so black background rects are removed, not
+    # recolored
+    # Backslashes are escaped so the gradient id is never read as a group
+    # reference in the replacement template
+    body = _FILL_HEX_RE.sub(fill.replace(b"\\", b"\\\\"), body)
 
-    return svg_content
+    return header + body
 
 
 # =============================================================================
@@ -858,6 +1013,114 @@ def render_text_svg(
 # =============================================================================
 
 
+@dataclass(frozen=True, slots=True)
+class _CliOption:
+    """
+    One command line option: the single definition of its flags and default.
+
+    _build_parser turns every entry of _CLI_OPTIONS into an add_argument()
+    call and _parse_args_fast dispatches on the same entries, so the fast
+    path and argparse cannot disagree about names, defaults or checks.
+
+    Attributes:
+        flags: Option strings, e.g. ("-f", "--font")
+        dest: Attribute name on the parsed arguments
+        default: Value when the option is absent
+        help: Help text shown by --help
+        metavar: Value placeholder for options taking a value; None marks a
+                 switch, which stores the opposite of its default
+        type: Conversion applied to the value (argparse's type=)
+        choices: Allowed values (argparse's choices=)
+    """
+
+    flags: tuple[str, ...]
+    dest: str
+    default: object
+    help: str
+    metavar: str | None = None
+    type: Callable[[str], object] | None = None
+    choices: tuple[str, ...] | None = None
+
+
+# Every option except the positional text argument, in --help order
+_CLI_OPTIONS: Final[tuple[_CliOption, ...]] = (
+    _CliOption(
+        ("-f", "--font"),
+        "font",
+        DEFAULT_FONT,
+        f"Font name for toilet/figlet (default: {DEFAULT_FONT})",
+        metavar="NAME",
+    ),
+    _CliOption(
+        ("-o", "--output"),
+        "output",
+        None,
+        "Output file path (default: stdout)",
+        metavar="FILE",
+        type=Path,
+    ),
+    _CliOption(
+        ("-g", "--gradient"),
+        "gradient",
+        DEFAULT_GRADIENT,
+        f"Gradient preset (default: {DEFAULT_GRADIENT})",
+        metavar="PRESET",
+        choices=tuple(preset.name.lower() for preset in GradientPreset),
+    ),
+    _CliOption(
+        ("--custom-gradient",),
+        "custom_gradient",
+        None,
+        "Custom gradient: '#color:offset,...' (e.g., '#ff0000:0,#0000ff:100')",
+        metavar="SPEC",
+    ),
+    _CliOption(
+        ("-s", "--scale"),
+        "scale",
+        DEFAULT_SCALE,
+        f"Pixel scale in SVG units (default: {DEFAULT_SCALE})",
+        metavar="N",
+        type=int,
+    ),
+    _CliOption(
+        ("--no-merge-runs",),
+        "merge_runs",
+        True,
+        "Emit one square per character instead of merging horizontal runs",
+    ),
+    _CliOption(
+        ("-t", "--text-mode"),
+        "text_mode",
+        False,
+        "Use toilet SVG text mode (preserves Unicode chars, best for 'future' font)",
+    ),
+    _CliOption(
+        ("--cache",),
+        "cache",
+        False,
+        "Cache rendered ASCII art on disk (pixel mode, in "
+        "$XDG_CACHE_HOME/svgheadergen, default ~/.cache/svgheadergen)",
+    ),
+    _CliOption(
+        ("--list-fonts",),
+        "list_fonts",
+        False,
+        "List available toilet fonts and exit",
+    ),
+    _CliOption(
+        ("-v", "--verbose"),
+        "verbose",
+        False,
+        "Enable verbose logging",
+    ),
+)
+
+# Flag string -> option, for the fast argv scanner (_parse_args_fast)
+_CLI_FLAGS: Final[dict[str, _CliOption]] = {
+    flag: option for option in _CLI_OPTIONS for flag in option.flags
+}
+
+
 def cli_main() -> int:
     """
     Command-line interface entry point.
@@ -878,97 +1141,21 @@ def cli_main() -> int:
     Returns:
         Integer exit code for sys.exit()
     """
-    # =========================================================================
-    # ARGUMENT PARSER SETUP
-    # =========================================================================
-
-    parser = argparse.ArgumentParser(
-        description="Generate pixel-perfect SVG headers from text using figlet/toilet.",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""\
-Examples:
-  %(prog)s "Hello World"
-  %(prog)s "Kitchn" -f bloody -g sweet_dracula -o header.svg
-  %(prog)s "Test" --scale 8 --font banner3
-  %(prog)s "Kitchn" -f future --text-mode -o header.svg
-  %(prog)s "Custom" --custom-gradient "#ff0000:0,#00ff00:50,#0000ff:100"
-
-Available gradient presets:
-  sweet_dracula  - Rainbow (default)
-  dracula_purple - Purple → Pink
-  cyber_cyan     - Cyan → Green
-  sunset         - Red → Orange → Yellow
-  mono_white     - Solid white
-
-Modes:
-  Default (pixel mode): Converts ASCII art to SVG paths (best for # based fonts)
-  --text-mode: Uses toilet SVG export (best for Unicode fonts like 'future')
-""",
-    )
-
-    parser.add_argument(
-        "text",
-        nargs="?",
-        help="Text to render",
-    )
-    parser.add_argument(
-        "-f",
-        "--font",
-        default=DEFAULT_FONT,
-        metavar="NAME",
-        help=f"Font name for toilet/figlet (default: {DEFAULT_FONT})",
-    )
-    parser.add_argument(
-        "-o",
-        "--output",
-        type=Path,
-        metavar="FILE",
-        help="Output file path (default: stdout)",
-    )
-    parser.add_argument(
-        "-g",
-        "--gradient",
-        default="sweet_dracula",
-        choices=[p.name.lower() for p in GradientPreset],
-        metavar="PRESET",
-        help="Gradient preset (default: sweet_dracula)",
-    )
-    parser.add_argument(
-        "--custom-gradient",
-        metavar="SPEC",
-        help="Custom gradient: '#color:offset,...' (e.g., '#ff0000:0,#0000ff:100')",
-    )
-    parser.add_argument(
-        "-s",
-        "--scale",
-        type=int,
-        default=DEFAULT_SCALE,
-        metavar="N",
-        help=f"Pixel scale in SVG units (default: {DEFAULT_SCALE})",
-    )
-    parser.add_argument(
-        "-t",
-        "--text-mode",
-        action="store_true",
-        help="Use toilet SVG text mode (preserves Unicode chars, best for 'future' font)",
-    )
-    parser.add_argument(
-        "--list-fonts",
-        action="store_true",
-        help="List available toilet fonts and exit",
-    )
-    parser.add_argument(
-        "-v",
-        "--verbose",
-        action="store_true",
-        help="Enable verbose logging",
-    )
-
     # =========================================================================
     # PARSE AND VALIDATE ARGUMENTS
     # =========================================================================
 
-    args = parser.parse_args()
+    # Common invocations are handled by a single scan of sys.argv; argparse is
+    # only imported and built for --help, usage errors and unusual spellings
+    # (abbreviated or combined flags), so it produces those messages as before
+    args = _parse_args_fast(sys.argv[1:])
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args()
+
+        # Text argument is required unless listing fonts
+        if not args.text and not args.list_fonts:
+            parser.error("the following arguments are required: text")
 
     # Enable debug logging if --verbose flag is set
     if args.verbose:
@@ -978,10 +1165,6 @@ Modes:
     if args.list_fonts:
         return _list_fonts()
 
-    # Text argument is required unless listing fonts
-    if not args.text:
-        parser.error("the following arguments are required: text")
-
     # =========================================================================
     # GENERATE SVG
     # =========================================================================
@@ -1009,11 +1192,11 @@ Modes:
             logger.debug("Using pixel mode with font: %s", args.font)
 
             # Step 1: Render text to ASCII grid
-            grid = render_text_grid(args.text, args.font)
+            grid = render_text_grid(args.text, args.font, disk_cache=args.cache)
             logger.debug("Grid size: %dx%d characters", grid.width, grid.height)
 
             # Step 2: Convert grid to SVG paths
-            path_result = grid_to_paths(grid, args.scale)
+            path_result = grid_to_paths(grid, args.scale, merge_runs=args.merge_runs)
             logger.debug("SVG size: %dx%d units", path_result.width, path_result.height)
 
             # Step 3: Generate final SVG with gradient
@@ -1025,11 +1208,15 @@ Modes:
 
         if args.output:
             # Write to file
-            args.output.write_text(svg, encoding="utf-8")
+            args.output.write_bytes(svg)
             logger.info("SVG written to %s", args.output)
         else:
             # Write to stdout (allows piping: svg_gen.py "Hi" > out.svg)
-            print(svg)
+            # The SVG is already UTF-8 bytes, so it goes straight to the binary
+            # buffer instead of being decoded for print() and encoded again
+            stdout = sys.stdout.buffer
+            stdout.write(svg)
+            stdout.write(b"\n")
 
         return 0  # Success
 
@@ -1052,6 +1239,406 @@ Modes:
 # =============================================================================
 
 
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the full argparse parser for the command line interface.
+
+    Only used when _parse_args_fast declines argv (--help, usage errors,
+    abbreviated flags), so argparse is imported here rather than at startup.
+    """
+    import argparse  # Deferred: costs several ms to import and set up
+
+    parser = argparse.ArgumentParser(
+        description="Generate pixel-perfect SVG headers from text using figlet/toilet.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""\
+Examples:
+  %(prog)s "Hello World"
+  %(prog)s "Kitchn" -f bloody -g sweet_dracula -o header.svg
+  %(prog)s "Test" --scale 8 --font banner3
+  %(prog)s "Kitchn" -f future --text-mode -o header.svg
+  %(prog)s "Custom" --custom-gradient "#ff0000:0,#00ff00:50,#0000ff:100"
+
+Available gradient presets:
+  sweet_dracula  - Rainbow (default)
+  dracula_purple - Purple → Pink
+  cyber_cyan     - Cyan → Green
+  sunset         - Red → Orange → Yellow
+  mono_white     - Solid white
+
+Modes:
+  Default (pixel mode): Converts ASCII art to SVG paths (best for # based fonts)
+  --text-mode: Uses toilet SVG export (best for Unicode fonts like 'future')
+""",
+    )
+
+    parser.add_argument(
+        "text",
+        nargs="?",
+        help="Text to render",
+    )
+    for option in _CLI_OPTIONS:
+        if option.metavar is None:
+            # Switch: present means the opposite of its default
+            parser.add_argument(
+                *option.flags,
+                dest=option.dest,
+                action="store_false" if option.default else "store_true",
+                help=option.help,
+            )
+        else:
+            parser.add_argument(
+                *option.flags,
+                dest=option.dest,
+                default=option.default,
+                type=option.type,
+                choices=option.choices,
+                metavar=option.metavar,
+                help=option.help,
+            )
+
+    return parser
+
+
+def _parse_args_fast(argv: list[str]) -> SimpleNamespace | None:
+    """
+    Parse argv in one pass with dict dispatch, without importing argparse.
+
+    Accepts exactly the flags in _CLI_OPTIONS (also as --long=value) and
+    returns a namespace with the same attributes argparse would set.
+    Returns None for anything else - help, unknown or abbreviated flags,
+    missing or invalid values, a missing or repeated text argument - so the
+    caller can fall back to argparse, which then prints the usual help text
+    or error message.
+    """
+    values: dict[str, object] = {}
+    args = iter(argv)
+    for arg in args:
+        if arg == "--":
+            # Everything after -- is positional
+            rest = list(args)
+            if len(rest) != 1 or "text" in values:
+                return None
+            values["text"] = rest[0]
+            break
+
+        if not arg.startswith("-") or arg == "-":
+            if "text" in values:
+                return None
+            values["text"] = arg
+            continue
+
+        flag, eq, value = arg.partition("=")
+        option = _CLI_FLAGS.get(flag)
+        if option is None:
+            return None
+
+        if option.metavar is None:
+            # Switch: present means the opposite of its default
+            if eq:
+                return None
+            values[option.dest] = not option.default
+            continue
+
+        if eq and not flag.startswith("--"):
+            return None
+        if not eq:
+            value = next(args, "-")
+            if value.startswith("-"):
+                # Missing value, or one argparse might read as a flag
+                return None
+
+        # Same conversion and check argparse applies (type=, choices=)
+        converted: object = value
+        if option.type is not None:
+            try:
+                converted = option.type(value)
+            except ValueError:
+                return None
+        if option.choices is not None and converted not in option.choices:
+            return None
+        values[option.dest] = converted
+
+    if not values.get("text") and not values.get("list_fonts"):
+        return None
+
+    namespace: dict[str, object] = {option.dest: option.default for option in _CLI_OPTIONS}
+    namespace["text"] = None
+    namespace.update(values)
+    return SimpleNamespace(**namespace)
+
+
+@functools.lru_cache(maxsize=256)
+def _toilet_svg(text: str, font: str) -> bytes:
+    """
+    Run toilet's SVG export and return its raw output.
+
+    Inputs must already be validated. Memoized because the subprocess
+    dominates text mode latency and its output depends only on (text, font);
+    failures raise and are therefore never cached.
+
+    Raises:
+        RenderError: If toilet is not installed, fails, or times out
+    """
+    import subprocess
+
+    # toilet not installed - this mode requires toilet specifically
+    not_found = "toilet not found - required for text mode SVG export"
+    toilet = _find_program("toilet")
+    if toilet is None:
+        raise RenderError(not_found)
+
+    # Run toilet with SVG export mode
+    # -E svg: Export format SVG
+    # -f font: Use specified font
+    # --: End of options (text starting with - won't be misinterpreted)
+    try:
+        # No text=True: the SVG stays raw bytes, skipping a decode here
+        # and the matching encode when it is written out
+        # Absolute path from _find_program: PATH is not searched again
+        result = subprocess.run(
+            [toilet, "-f", font, "-E", "svg", "--", text],
+            capture_output=True,
+            check=True,
+            timeout=30,
+        )
+    except FileNotFoundError:
+        # Removed since PATH was probed
+        raise RenderError(not_found) from None
+    except subprocess.CalledProcessError as e:
+        # toilet returned error (e.g., font not found)
+        msg = f"toilet failed: {e.stderr.decode('utf-8', errors='replace')}"
+        raise RenderError(msg) from e
+    except subprocess.TimeoutExpired as e:
+        msg = "toilet command timed out"
+        raise RenderError(msg) from e
+
+    return result.stdout
+
+
+@functools.cache
+def _find_program(name: str) -> str | None:
+    """
+    Return the absolute path of an installed program, or None.
+
+    PATH is probed once per process and name, so systems without toilet no
+    longer pay for a failed exec on every render.
+    """
+    import shutil
+
+    return shutil.which(name)
+
+
+def _find_ascii_renderers() -> tuple[str, ...]:
+    """
+    Return the absolute paths of the installed ASCII art renderers.
+
+    toilet is preferred over figlet.
+    """
+    return tuple(path for name in ("toilet", "figlet") if (path := _find_program(name)))
+
+
+def _run_renderer(cmd: list[str], timeout: float) -> tuple[int, bytes]:
+    """
+    Run a renderer and return its exit status and raw stdout.
+
+    cmd[0] must be an absolute path (as returned by shutil.which), so the
+    child is started without searching PATH again.
+
+    Security: shell=False (default) prevents shell injection.
+    stdout is read as raw bytes through a large pipe buffer so callers can
+    decode it exactly once; stderr is discarded - only the exit status
+    decides success.
+
+    Raises:
+        subprocess.TimeoutExpired: If the renderer runs longer than timeout
+                                   (the child is killed first)
+    """
+    import subprocess
+
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        bufsize=64 * 1024,
+    ) as proc:
+        try:
+            raw, _ = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            raise
+    return proc.returncode, raw
+
+
+def _render_ascii_lines(text: str, font: str) -> list[str]:
+    """
+    Run toilet or figlet and return the raw ASCII art lines.
+
+    Inputs must already be validated. Lines are returned unpadded, exactly
+    as the renderer printed them (minus the trailing newline).
+
+    Raises:
+        RenderError: If neither toilet nor figlet is available, or rendering fails
+    """
+    import subprocess
+
+    # Only try renderers that are actually installed, toilet first
+    # (more features), then figlet (more common)
+    renderers = _find_ascii_renderers()
+    if not renderers:
+        msg = "Neither toilet nor figlet available"
+        raise RenderError(msg)
+
+    last_error: Exception | None = None
+    for renderer in renderers:
+        # The "--" separates options from text, preventing text starting with "-"
+        # from being interpreted as an option
+        cmd = [renderer, "-f", font, "--", text]
+
+        try:
+            # timeout=30 prevents hanging on pathological inputs
+            returncode, raw = _run_renderer(cmd, timeout=30)
+        except subprocess.TimeoutExpired as e:
+            # Tool took too long - fail immediately, don't try fallback
+            msg = f"Command timed out: {' '.join(cmd)}"
+            raise RenderError(msg) from e
+
+        if returncode == 0:
+            break  # Success - exit the loop
+
+        # Tool returned error (e.g., font not found), try the next one
+        last_error = subprocess.CalledProcessError(returncode, cmd, raw)
+    else:
+        # Loop completed without break = all installed renderers failed
+        msg = "All available renderers failed: " + ", ".join(renderers)
+        raise RenderError(msg) from last_error
+
+    # Process the ASCII art output
+    # Decode the whole buffer in a single pass (UTF-8, since some fonts emit
+    # box-drawing characters), then remove trailing newline and split into
+    # individual lines
+    raw_lines = raw.decode("utf-8", errors="replace").rstrip("\n").split("\n")
+
+    # Sanity check: ensure we got actual output
+    if not raw_lines or all(not line for line in raw_lines):
+        msg = f"No output from {cmd[0]} for text: {text!r}"
+        raise RenderError(msg)
+
+    return raw_lines
+
+
+@functools.cache
+def _cache_dir() -> Path | None:
+    """
+    Return the directory for the on-disk caches, or None if there is none.
+
+    Follows the XDG base directory spec, defaulting to ~/.cache/svgheadergen.
+    Resolved on first use rather than at import: Path.home() raises when
+    HOME is unset and the user has no passwd entry, which must not break
+    importing the module or runs that never use a cache.
+    """
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        try:
+            base = str(Path.home() / ".cache")
+        except RuntimeError:
+            return None
+    return Path(base) / "svgheadergen"
+
+
+def _grid_cache_file(text: str, font: str) -> Path | None:
+    """
+    Return the on-disk cache file for a (text, font) pair, if caching is possible.
+
+    The key is a hash of the JSON-encoded pair, so arbitrary text maps to a
+    safe, fixed-length file name. The resolved renderer paths are hashed in
+    too: installing or removing toilet/figlet changes which one draws the
+    art, so entries rendered by the other must not be served.
+    """
+    import hashlib
+    import json
+
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+    key_material = json.dumps([text, font, _find_ascii_renderers()]).encode("utf-8")
+    key = hashlib.blake2b(key_material, digest_size=16).hexdigest()
+    return cache_dir / "grid" / f"{key}.json"
+
+
+def _read_grid_cache(cache_file: Path) -> list[str] | None:
+    """
+    Load cached ASCII art lines, or None on a cache miss.
+
+    JSON is used instead of pickle so a tampered cache file cannot execute
+    code. Unreadable or malformed entries are treated as misses.
+    """
+    import json
+
+    try:
+        lines = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not lines or not isinstance(lines, list):
+        return None
+    if not all(isinstance(line, str) for line in lines):
+        return None
+    return lines
+
+
+def _write_cache_json(cache_file: Path | None, data: object) -> None:
+    """
+    Store data as JSON in an on-disk cache file (render or font list cache).
+
+    The caches are best-effort: write failures are logged and ignored.
+    """
+    import json
+
+    if cache_file is None:
+        return
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(data), encoding="utf-8")
+    except OSError as e:
+        logger.debug("Could not write cache %s: %s", cache_file, e)
+
+
+def _fonts_cache_file() -> Path | None:
+    """Return the --list-fonts result cache file, if caching is possible."""
+    cache_dir = _cache_dir()
+    return cache_dir / "fonts.json" if cache_dir is not None else None
+
+
+def _read_fonts_cache(toilet: str) -> tuple[Path, list[str]] | None:
+    """
+    Load the cached font list, or None if it is missing or stale.
+
+    The entry is stale when it was produced by a different toilet binary
+    (toilet moved or another one now comes first on PATH), or when the
+    cached font directory's modification time (which changes whenever a
+    font file is added or removed) no longer matches the one recorded with
+    it.
+    """
+    import json
+
+    cache_file = _fonts_cache_file()
+    if cache_file is None:
+        return None
+    try:
+        entry = json.loads(cache_file.read_text(encoding="utf-8"))
+        font_dir = Path(entry["font_dir"])
+        fonts = entry["fonts"]
+        if entry["toilet"] != toilet:
+            return None
+        if font_dir.stat().st_mtime_ns != entry["mtime_ns"]:
+            return None
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+    if not isinstance(fonts, list) or not all(isinstance(font, str) for font in fonts):
+        return None
+    return font_dir, fonts
+
+
 def _list_fonts() -> int:
     """
     List available toilet/figlet fonts.
@@ -1063,34 +1650,70 @@ def _list_fonts() -> int:
         .tlf - TOIlet font files (toilet-specific)
         .flf - FIGlet font files (compatible with both toilet and figlet)
 
+    The result is cached in fonts.json in the cache directory (see
+    _cache_dir) together with the toilet path and the font directory's
+    modification time.
+    While the directory is unchanged (no fonts added or removed), repeated
+    calls - e.g. from shell completion - skip both the toilet subprocess
+    and the directory scan.
+
     Returns:
         0 on success, 1 on error
     """
-    try:
-        # toilet -I2 returns the font directory path
-        # This is a toilet-specific info flag
-        result = subprocess.run(
-            ["toilet", "-I2"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        font_dir = Path(result.stdout.strip())
-
-        if font_dir.is_dir():
-            logger.info("Available fonts in %s:", font_dir)
+    import subprocess
 
-            # Collect both toilet (.tlf) and figlet (.flf) fonts
-            # .stem extracts filename without extension
-            fonts = sorted(f.stem for f in font_dir.glob("*.tlf")) + sorted(
-                f.stem for f in font_dir.glob("*.flf")
-            )
+    # Checked before the cache (the lookup is itself cached), so a stale
+    # list is never printed once toilet is gone
+    toilet = _find_program("toilet")
+    if toilet is None:
+        logger.error("Failed to list fonts: toilet not found")
+        return 1
 
-            # Print each font name indented for readability
-            for font in fonts:
-                print(f"  {font}")
+    try:
+        cached = _read_fonts_cache(toilet)
+        if cached is not None:
+            font_dir, fonts = cached
         else:
-            logger.warning("Font directory not found: %s", font_dir)
+            # toilet -I2 returns the font directory path
+            # This is a toilet-specific info flag
+            _, raw = _run_renderer([toilet, "-I2"], timeout=10)
+            font_dir = Path(raw.decode("utf-8", errors="replace").strip())
+
+            if not font_dir.is_dir():
+                logger.warning("Font directory not found: %s", font_dir)
+                return 0
+
+            # Read the directory's modification time before scanning it: a
+            # font added during the scan then leaves the recorded mtime stale,
+            # so the next call rescans instead of trusting an incomplete list
+            mtime_ns = font_dir.stat().st_mtime_ns
+
+            # Collect both toilet (.tlf) and figlet (.flf) fonts in a single
+            # directory scan; toilet fonts are listed first, each group sorted
+            # by name (the [:-4] strips the extension)
+            with os.scandir(font_dir) as entries:
+                found = [
+                    (entry.name.endswith(".flf"), entry.name[:-4])
+                    for entry in entries
+                    if entry.name.endswith((".tlf", ".flf"))
+                ]
+            fonts = [name for _, name in sorted(found)]
+            # Recorded with the toilet binary that reported font_dir and the
+            # directory's modification time, which _read_fonts_cache checks
+            # to detect a different toilet or added/removed fonts
+            entry = {
+                "toilet": toilet,
+                "font_dir": str(font_dir),
+                "mtime_ns": mtime_ns,
+                "fonts": fonts,
+            }
+            _write_cache_json(_fonts_cache_file(), entry)
+
+        logger.info("Available fonts in %s:", font_dir)
+
+        # Print each font name indented for readability
+        for font in fonts:
+            print(f"  {font}")
 
         return 0
     except (subprocess.SubprocessError, OSError) as e: